@@ -4,6 +4,7 @@ const cors = require('cors');
 const { exec, spawn } = require('child_process');
 const path = require('path');
 const fs = require('fs');
+const http = require('http');
 
 // Check if dockerode is installed
 let Docker;
@@ -23,13 +24,21 @@ let dockerAvailable = false;
 
 if (Docker) {
     try {
+        // Node 19+ already reuses Docker API sockets through the keep-alive global agent.
+        // On older runtimes, supply an equivalent agent (same 5s idle timeout, so stale
+        // sockets are dropped before the daemon resets them) for the local socket/pipe only -
+        // a DOCKER_HOST over TLS needs an https agent.
+        const keepAlive = http.globalAgent.keepAlive || process.env.DOCKER_HOST
+            ? {}
+            : { agent: new http.Agent({ keepAlive: true, timeout: 5000, maxSockets: 32 }) };
+        
         // For Windows, try to connect to Docker Desktop
         if (process.platform === 'win32') {
             // Try Windows named pipe first
-            docker = new Docker({ socketPath: '//./pipe/docker_engine' });
+            docker = new Docker({ socketPath: '//./pipe/docker_engine', ...keepAlive });
         } else {
             // For Linux/Mac
-            docker = new Docker();
+            docker = new Docker(keepAlive);
         }
         
         // Test Docker connection
@@ -83,14 +92,12 @@ async function getContainerIP(containerName) {
 
 // API Endpoints
 app.get('/api/nodes', async (req, res) => {
-    const nodesInfo = [];
-    
     if (!dockerAvailable) {
-        return res.json(nodesInfo);
+        return res.json([]);
     }
     
-    // Get container nodes
-    for (const [nodeName, containerInfo] of Object.entries(containerNodes)) {
+    // Get container nodes - inspect them concurrently rather than one round-trip at a time
+    const nodesInfo = await Promise.all(Object.entries(containerNodes).map(async ([nodeName, containerInfo]) => {
         try {
             const container = docker.getContainer(containerInfo.containerId);
             const info = await container.inspect();
@@ -98,7 +105,7 @@ app.get('/api/nodes', async (req, res) => {
                       info.NetworkSettings.Networks['bridge']?.IPAddress || 
                       'unknown';
             
-            nodesInfo.push({
+            return {
                 name: nodeName,
                 port: containerInfo.port,
                 status: info.State.Running ? 'running' : 'stopped',
@@ -106,13 +113,14 @@ app.get('/api/nodes', async (req, res) => {
                 containerId: containerInfo.containerId,
                 ip: ip,
                 accessUrl: `http://localhost:${containerInfo.port}`
-            });
+            };
         } catch (error) {
             console.error(`Error inspecting container ${nodeName}:`, error.message);
+            return null;
         }
-    }
+    }));
     
-    res.json(nodesInfo);
+    res.json(nodesInfo.filter(Boolean));
 });
 
 // Launch node in Docker container
@@ -394,7 +402,7 @@ async function cleanup() {
     if (!dockerAvailable) return;
     
     console.log('Cleaning up containers...');
-    for (const [nodeName, nodeInfo] of Object.entries(containerNodes)) {
+    await Promise.all(Object.entries(containerNodes).map(async ([nodeName, nodeInfo]) => {
         try {
             const container = docker.getContainer(nodeInfo.containerId);
             await container.stop();
@@ -403,7 +411,7 @@ async function cleanup() {
         } catch (error) {
             console.error(`Error cleaning up ${nodeName}:`, error.message);
         }
-    }
+    }));
 }
 
 // Handle shutdown
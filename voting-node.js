@@ -8,6 +8,14 @@ const path = require('path');
 const fs = require('fs');
 const dgram = require('dgram'); // NEW: Add dgram for UDP broadcast
 const DISCOVERY_PORT = 41234; // A dedicated port for UDP discovery
+// Broadcast message types that are also forwarded to GUI clients
+const GUI_BROADCAST_TYPES = new Set(['ROUND_START', 'PHASE_CHANGE', 'RESULTS', 'ENCRYPTED_VOTE', 'RESULT_PROPOSAL', 'STATUS_UPDATE']);
+
+// One-shot crypto.hash (Node 20.12+, as in the Docker images) avoids a Hash object per call;
+// createHash covers nodes run locally on an older Node
+const sha256Hex = typeof crypto.hash === 'function'
+    ? (data) => crypto.hash('sha256', data)
+    : (data) => crypto.createHash('sha256').update(data).digest('hex');
 
 class VotingNodeWithAutoGUI {
     constructor(nodeId, port, knownPeers = [], options = {}) {
@@ -17,11 +25,13 @@ class VotingNodeWithAutoGUI {
         this.peers = new Map(); // nodeId -> WebSocket
         this.activePeers = new Set();
 		this.peerAddresses = new Map(); // nodeId -> {host, port} - Track peer addresses
+		this.peerAddressIndex = new Map(); // "host:port" -> nodeId - Reverse lookup for peerAddresses
         this.server = null;
         this.currentRound = null;
         this.votes = new Map(); // roundId -> Map(nodeId -> vote)
         this.encryptedVotes = new Map(); // roundId -> Map(nodeId -> encryptedVote)
         this.voteKeys = new Map(); // roundId -> Map(nodeId -> decryptionKey)
+        this.keyProviders = new Map(); // roundId -> Set(nodeId) of nodes that have shared keys
         this.results = new Map();
         this.heartbeatInterval = null;
         this.myVoteTracking = new Map(); // roundId -> {anonymousVoteId, choice, timestamp, verified}
@@ -299,6 +309,11 @@ class VotingNodeWithAutoGUI {
 	}
 	
 	startDiscovery() {
+        // Our presence payload never changes, so encode it once
+        this.presenceMessage = Buffer.from(JSON.stringify({
+            nodeId: this.nodeId,
+            port: this.port // This is our WebSocket port
+        }));
         this.discoverySocket = dgram.createSocket('udp4');
 
         this.discoverySocket.on('listening', () => {
@@ -312,6 +327,11 @@ class VotingNodeWithAutoGUI {
         });
 
         this.discoverySocket.on('message', (message, rinfo) => {
+            // Our own broadcasts loop back every 5s - drop them on the raw bytes before parsing
+            if (message.equals(this.presenceMessage)) {
+                return;
+            }
+            
             try {
                 const peerInfo = JSON.parse(message.toString());
 
@@ -322,7 +342,7 @@ class VotingNodeWithAutoGUI {
 
                 // Check if we are already connected or trying to connect
                 const isConnected = this.peers.has(peerInfo.nodeId);
-                const isKnown = Array.from(this.peerAddresses.values()).some(addr => addr.host === rinfo.address && addr.port === peerInfo.port);
+                const isKnown = this.peerAddressIndex.has(`${rinfo.address}:${peerInfo.port}`);
 
                 if (!isConnected && !isKnown) {
                     console.log(`Discovered peer ${peerInfo.nodeId} at ${rinfo.address}:${peerInfo.port}`);
@@ -345,11 +365,7 @@ class VotingNodeWithAutoGUI {
     }
 	
 	broadcastPresence() {
-		const message = JSON.stringify({
-			nodeId: this.nodeId,
-			port: this.port // This is our WebSocket port
-		});
-		const messageBuffer = Buffer.from(message);
+		const messageBuffer = this.presenceMessage;
 
 		// Get broadcast address from environment variable or use default
 		const broadcastAddress = process.env.BROADCAST_ADDRESS || '255.255.255.255';
@@ -378,15 +394,17 @@ class VotingNodeWithAutoGUI {
     async connectToKnownPeers() {
         console.log(`Connecting to ${this.knownPeers.length} known peers...`);
         
-        for (const peer of this.knownPeers) {
-            try {
-                await this.connectToPeer(peer.host, peer.port);
-                // Small delay between connections to avoid overwhelming
-                await new Promise(resolve => setTimeout(resolve, 500));
-            } catch (error) {
-                console.log(`Failed to connect to ${peer.host}:${peer.port} - ${error.message}`);
+        // Dial all known peers concurrently - the handshakes are independent
+        const results = await Promise.allSettled(this.knownPeers.map(peer =>
+            this.connectToPeer(peer.host, peer.port)
+        ));
+        
+        results.forEach((result, i) => {
+            if (result.status === 'rejected') {
+                const peer = this.knownPeers[i];
+                console.log(`Failed to connect to ${peer.host}:${peer.port} - ${result.reason.message}`);
             }
-        }
+        });
         
         console.log(`Connection phase complete. Connected to ${this.peers.size} peers.`);
     }
@@ -585,6 +603,16 @@ class VotingNodeWithAutoGUI {
 		});
 	}
 	
+	setPeerAddress(nodeId, host, port) {
+		const previous = this.peerAddresses.get(nodeId);
+		if (previous && this.peerAddressIndex.get(`${previous.host}:${previous.port}`) === nodeId) {
+			this.peerAddressIndex.delete(`${previous.host}:${previous.port}`);
+		}
+		
+		this.peerAddresses.set(nodeId, { host, port });
+		this.peerAddressIndex.set(`${host}:${port}`, nodeId);
+	}
+	
 	handleIncomingConnection(ws, req) {
 		console.log(`Incoming connection from ${req.socket.remoteAddress}`);
 		
@@ -734,9 +762,13 @@ class VotingNodeWithAutoGUI {
     }
     
     sendStatusToGUI(ws) {
+        ws.send(this.buildStatusMessage());
+    }
+    
+    buildStatusMessage() {
         const status = this.getCurrentRoundStatus();
         
-        ws.send(JSON.stringify({
+        return JSON.stringify({
             type: 'STATUS_UPDATE',
             data: {
                 nodeId: this.nodeId,
@@ -748,15 +780,19 @@ class VotingNodeWithAutoGUI {
                 encryptedVotes: typeof status === 'object' ? status.encryptedVoteCount : 0,
                 decryptedVotes: typeof status === 'object' ? status.decryptedVoteCount : 0
             }
-        }));
+        });
     }
     
     // Add periodic status updates for GUI clients
     startGUIUpdates() {
         setInterval(() => {
+            if (this.guiClients.size === 0) return;
+            
+            // Status is node-wide, so serialize once and reuse for every client
+            const statusMessage = this.buildStatusMessage();
             for (const [clientId, ws] of this.guiClients) {
                 if (ws.readyState === WebSocket.OPEN) {
-                    this.sendStatusToGUI(ws);
+                    ws.send(statusMessage);
                 }
             }
         }, 2000); // Update every 2 seconds
@@ -781,10 +817,7 @@ class VotingNodeWithAutoGUI {
 					const remoteAddress = ws._socket ? ws._socket.remoteAddress : 'localhost';
 					const host = remoteAddress === '::1' || remoteAddress === '127.0.0.1' ? 'localhost' : remoteAddress;
 					
-					this.peerAddresses.set(message.from, {
-						host: host,
-						port: message.port
-					});
+					this.setPeerAddress(message.from, host, message.port);
 					console.log(`Stored address for ${message.from}: ${host}:${message.port}`);
 				}
 				
@@ -818,10 +851,7 @@ class VotingNodeWithAutoGUI {
 					const remoteAddress = ws._socket ? ws._socket.remoteAddress : 'localhost';
 					const host = remoteAddress === '::1' || remoteAddress === '127.0.0.1' ? 'localhost' : remoteAddress;
 					
-					this.peerAddresses.set(message.from, {
-						host: host,
-						port: message.port
-					});
+					this.setPeerAddress(message.from, host, message.port);
 					console.log(`Stored address for ${message.from}: ${host}:${message.port}`);
 				}
 				
@@ -849,7 +879,9 @@ class VotingNodeWithAutoGUI {
 				break;
 				
 			case 'ENCRYPTED_VOTE':
-				this.handleEncryptedVote(message);
+				if (!this.handleEncryptedVote(message)) {
+					break;
+				}
 				// ENHANCED: Notify GUI clients about new encrypted vote
 				this.notifyGUIClients('VOTE_RECEIVED', {
 					roundId: message.roundId,
@@ -913,12 +945,15 @@ class VotingNodeWithAutoGUI {
     // === ENCRYPTION UTILITIES ===
     
     encryptVote(choice, roundId) {
+        // Draw key, IV and anonymous ID from a single CSPRNG call
+        const random = crypto.randomBytes(64);
+        
         // Generate a random key for this vote
-        const key = crypto.randomBytes(32);
-        const iv = crypto.randomBytes(16);
+        const key = random.subarray(0, 32);
+        const iv = random.subarray(32, 48);
         
         // Generate a random anonymous ID for this vote (not tied to node identity)
-        const anonymousVoteId = crypto.randomBytes(16).toString('hex');
+        const anonymousVoteId = random.subarray(48, 64).toString('hex');
         
         // Create cipher with IV
         const cipher = crypto.createCipheriv('aes-256-cbc', key, iv);
@@ -932,24 +967,23 @@ class VotingNodeWithAutoGUI {
             // Note: NO voter field to maintain anonymity
         });
         
-        let encrypted = cipher.update(voteData, 'utf8', 'hex');
-        encrypted += cipher.final('hex');
+        // Wire format: base64(IV[16] || ciphertext) - one compact field instead of hex IV + ciphertext
+        const encrypted = Buffer.concat([iv, cipher.update(voteData, 'utf8'), cipher.final()]).toString('base64');
         
         return {
             encryptedData: encrypted,
             key: key.toString('hex'),
-            iv: iv.toString('hex'),
             anonymousVoteId: anonymousVoteId
         };
     }
     
-    decryptVote(encryptedData, keyHex, ivHex) {
+    decryptVote(encryptedData, keyHex) {
         try {
             const key = Buffer.from(keyHex, 'hex');
-            const iv = Buffer.from(ivHex, 'hex');
-            const decipher = crypto.createDecipheriv('aes-256-cbc', key, iv);
+            const payload = Buffer.from(encryptedData, 'base64');
+            const decipher = crypto.createDecipheriv('aes-256-cbc', key, payload.subarray(0, 16));
             
-            let decrypted = decipher.update(encryptedData, 'hex', 'utf8');
+            let decrypted = decipher.update(payload.subarray(16), undefined, 'utf8');
             decrypted += decipher.final('utf8');
             
             return JSON.parse(decrypted);
@@ -1017,7 +1051,6 @@ class VotingNodeWithAutoGUI {
             roundId: this.currentRound.id,
             anonymousVoteId: encryptedVote.anonymousVoteId,
             encryptedData: encryptedVote.encryptedData,
-            iv: encryptedVote.iv,
             timestamp: Date.now(),
             // Note: NO 'from' field to maintain anonymity of vote content
             signature: this.signMessage(`${this.currentRound.id}_${encryptedVote.encryptedData}`)
@@ -1035,27 +1068,34 @@ class VotingNodeWithAutoGUI {
         console.log(`Total encrypted votes received: ${this.encryptedVotes.get(this.currentRound.id).size}`);
     }
 
+    // Returns true only when the vote was newly stored
     handleEncryptedVote(message) {
         if (!this.currentRound || message.roundId !== this.currentRound.id) {
-            return;
+            return false;
         }
         
         if (this.currentRound.phase !== 'VOTING') {
-            return;
+            return false;
         }
         
-        if (!this.verifySignature(message.signature, `${message.roundId}_${message.encryptedData}`, 'anonymous')) {
-            // Skip signature verification for anonymous votes or implement a different verification method
-        }
+        // Anonymous votes carry no verifiable sender, so the signature is not checked here
         
         // Store encrypted vote by anonymous ID
         if (!this.encryptedVotes.has(this.currentRound.id)) {
             this.encryptedVotes.set(this.currentRound.id, new Map());
         }
-        this.encryptedVotes.get(this.currentRound.id).set(message.anonymousVoteId, message);
+        const roundVotes = this.encryptedVotes.get(this.currentRound.id);
+        
+        // Drop replays at ingress - first ciphertext seen for an anonymous ID wins
+        if (roundVotes.has(message.anonymousVoteId)) {
+            console.log(`Ignoring duplicate encrypted vote (ID: ${message.anonymousVoteId.substring(0, 8)}...)`);
+            return false;
+        }
+        roundVotes.set(message.anonymousVoteId, message);
         
         console.log(`Received anonymous encrypted vote (ID: ${message.anonymousVoteId.substring(0, 8)}...)`);
-        console.log(`Total encrypted votes received: ${this.encryptedVotes.get(this.currentRound.id).size}`);
+        console.log(`Total encrypted votes received: ${roundVotes.size}`);
+        return true;
     }
 
     // Enhanced enterConsensusPhase to notify GUI clients
@@ -1071,6 +1111,10 @@ class VotingNodeWithAutoGUI {
 		console.log('\n=== CONSENSUS PHASE ===');
 		console.log('Revealing anonymous votes and calculating results...');
 		
+		// Our own keys never arrive in a peer's batch, so decrypt our ballots now -
+		// otherwise early peer proposals are compared against a tally missing our vote
+		this.decryptAndProcessVotes(this.getOwnVoteIds(this.currentRound.id));
+		
 		// Broadcast phase change to ensure all nodes know we're in consensus
 		this.broadcast({
 			type: 'PHASE_CHANGE',
@@ -1097,6 +1141,17 @@ class VotingNodeWithAutoGUI {
 	}
 
 
+    // Anonymous IDs of the ballots this node cast in the round (keys stored locally by castVote)
+    getOwnVoteIds(roundId) {
+        const ownVoteIds = [];
+        for (const [anonymousVoteId, keyData] of this.voteKeys.get(roundId) || []) {
+            if (keyData.submittedBy === this.nodeId) {
+                ownVoteIds.push(anonymousVoteId);
+            }
+        }
+        return ownVoteIds;
+    }
+
     shareAllKeys() {
 		const roundKeys = this.voteKeys.get(this.currentRound.id);
 		
@@ -1106,17 +1161,11 @@ class VotingNodeWithAutoGUI {
 			return;
 		}
 		
-		// Collect our keys to share
-		const keysToShare = [];
-		for (const [anonymousVoteId, keyData] of roundKeys) {
-			// Only share keys where we are the original submitter
-			if (keyData.submittedBy === this.nodeId) {
-				keysToShare.push({
-					anonymousVoteId: anonymousVoteId,
-					key: keyData.key
-				});
-			}
-		}
+		// Collect our keys to share - only keys where we are the original submitter
+		const keysToShare = this.getOwnVoteIds(this.currentRound.id).map(anonymousVoteId => ({
+			anonymousVoteId: anonymousVoteId,
+			key: roundKeys.get(anonymousVoteId).key
+		}));
 		
 		if (keysToShare.length === 0) {
 			console.log('No keys from our votes to share');
@@ -1161,23 +1210,25 @@ class VotingNodeWithAutoGUI {
             this.voteKeys.set(this.currentRound.id, new Map());
         }
         
-        let newKeysCount = 0;
+        const newKeyIds = [];
         for (const keyInfo of message.keys) {
             if (!this.voteKeys.get(this.currentRound.id).has(keyInfo.anonymousVoteId)) {
                 this.voteKeys.get(this.currentRound.id).set(keyInfo.anonymousVoteId, {
                     key: keyInfo.key,
                     keyProvider: message.from // We know who provided the batch, but not which specific key
                 });
-                newKeysCount++;
+                newKeyIds.push(keyInfo.anonymousVoteId);
             }
         }
         
+        const newKeysCount = newKeyIds.length;
         if (newKeysCount > 0) {
+            this.recordKeyProvider(this.currentRound.id, message.from);
             console.log(`Received batch of ${newKeysCount} decryption keys from ${message.from}`);
             console.log(`Keys shuffled to prevent correlation with vote submission order`);
             
-            // Try to decrypt votes now that we have more keys
-            this.decryptAndProcessVotes();
+            // Try to decrypt the votes this batch unlocked
+            this.decryptAndProcessVotes(newKeyIds);
             
             // Check if we should propose results now that we have more keys
             if (!this.resultProposed) {
@@ -1206,11 +1257,12 @@ class VotingNodeWithAutoGUI {
                 key: message.key,
                 keyProvider: message.from
             });
+            this.recordKeyProvider(this.currentRound.id, message.from);
             
             console.log(`Received decryption key for vote ${message.anonymousVoteId.substring(0, 8)}... from ${message.from}`);
             
             // Try to decrypt the vote now that we have the key
-            this.decryptAndProcessVotes();
+            this.decryptAndProcessVotes([message.anonymousVoteId]);
             
             // Check if we should propose results now that we have more keys
             if (!this.resultProposed) {
@@ -1219,7 +1271,19 @@ class VotingNodeWithAutoGUI {
         }
     }
 
-    decryptAndProcessVotes() {
+    // Track key providers as keys arrive so the ready check doesn't rescan every key
+    recordKeyProvider(roundId, nodeId) {
+        // Messages without a sender must not count as an extra provider
+        if (!nodeId) return;
+        
+        if (!this.keyProviders.has(roundId)) {
+            this.keyProviders.set(roundId, new Set());
+        }
+        this.keyProviders.get(roundId).add(nodeId);
+    }
+
+    // Pass the IDs of newly received keys to only try those votes; omit to sweep the whole round
+    decryptAndProcessVotes(anonymousVoteIds = null) {
         if (!this.currentRound) return;
         
         const roundId = this.currentRound.id;
@@ -1236,14 +1300,14 @@ class VotingNodeWithAutoGUI {
         
         let newlyDecrypted = 0;
         
-        // Try to decrypt all votes for which we have keys
-        for (const [anonymousVoteId, encryptedVote] of encryptedVotes) {
-            if (voteKeys.has(anonymousVoteId) && !decryptedVotes.has(anonymousVoteId)) {
+        // Try to decrypt all candidate votes for which we have keys
+        for (const anonymousVoteId of (anonymousVoteIds || encryptedVotes.keys())) {
+            const encryptedVote = encryptedVotes.get(anonymousVoteId);
+            if (encryptedVote && voteKeys.has(anonymousVoteId) && !decryptedVotes.has(anonymousVoteId)) {
                 const keyData = voteKeys.get(anonymousVoteId);
                 const decryptedData = this.decryptVote(
                     encryptedVote.encryptedData, 
-                    keyData.key, 
-                    encryptedVote.iv
+                    keyData.key
                 );
                 
                 if (decryptedData) {
@@ -1255,12 +1319,15 @@ class VotingNodeWithAutoGUI {
                         roundId: decryptedData.roundId
                         // Note: No voter identity stored
                     });
+                    const choice = decryptedData.choice.toLowerCase();
+                    this.currentRound.tally.set(choice, (this.currentRound.tally.get(choice) || 0) + 1);
                     newlyDecrypted++;
                 }
             }
         }
         
         if (newlyDecrypted > 0) {
+            this.currentRound.resultsCache = null;
             console.log(`Successfully decrypted ${newlyDecrypted} more anonymous votes`);
             console.log(`Total decrypted votes: ${decryptedVotes.size}/${encryptedVotes.size}`);
         }
@@ -1285,10 +1352,7 @@ class VotingNodeWithAutoGUI {
 		}
 		
 		// ENHANCED: Send voting-related updates to ALL GUI clients
-		const votingEvents = ['ROUND_START', 'PHASE_CHANGE', 'RESULTS', 'ENCRYPTED_VOTE', 'RESULT_PROPOSAL'];
-		const shouldSendToGUI = votingEvents.includes(message.type) || message.type === 'STATUS_UPDATE';
-		
-		if (shouldSendToGUI) {
+		if (GUI_BROADCAST_TYPES.has(message.type)) {
 			for (const [clientId, ws] of this.guiClients) {
 				if (ws.readyState === WebSocket.OPEN) {
 					try {
@@ -1320,44 +1384,54 @@ class VotingNodeWithAutoGUI {
 
     // === VOTING ROUNDS ===
 
-    startVotingRound(topic, allowedChoices = null, votingTimeSeconds = 100) {
-        if (this.currentRound && this.currentRound.phase !== 'FINISHED') {
-            console.log('A voting round is already active!');
-            return;
-        }
-
-        // Validate voting time: min 30 seconds, max 600 seconds (10 minutes), default 100 seconds
-        // Note: This is pure voting time - consensus phase gets additional fixed time
-        if (typeof votingTimeSeconds !== 'number' || votingTimeSeconds < 30 || votingTimeSeconds > 600) {
-            console.log(`Invalid voting time: ${votingTimeSeconds}s. Using default 100 seconds.`);
-            console.log('   Valid range: 30-600 seconds (0.5-10 minutes) for voting phase only');
-            votingTimeSeconds = 100;
-        }
-
-        const roundId = `round_${Date.now()}_${this.nodeId}`;
-        
+    // Single place round objects are built, so every round carries its tally state
+    createRound(id, topic, allowedChoices, startTime, votingTimeSeconds) {
         // Separate voting and consensus phases
         const votingPhaseMs = votingTimeSeconds * 1000;  // User-specified voting time
         const consensusPhaseMs = 15000;  // Fixed 15 seconds for consensus
-        const totalRoundMs = votingPhaseMs + consensusPhaseMs;  // Total round duration
         
-        const round = {
-            id: roundId,
+        return {
+            id: id,
             topic: topic,
             allowedChoices: allowedChoices,
-            startTime: Date.now(),
-            duration: totalRoundMs,  // Total duration includes both phases
+            startTime: startTime,
+            duration: votingPhaseMs + consensusPhaseMs,  // Total duration includes both phases
             votingTimeSeconds: votingTimeSeconds,  // Store original voting time
             votingPhaseMs: votingPhaseMs,  // Voting phase duration
             consensusPhaseMs: consensusPhaseMs,  // Consensus phase duration
             phase: 'VOTING',
             votes: new Map(),
             results: null,
+            tally: new Map(),  // choice -> count, updated as votes are decrypted
+            resultsCache: null,  // Memoized tally, cleared whenever a vote is decrypted
             consensusAchieved: false,
             consensusNodes: new Set(),
             consensusTimeout: null,
             finishTimeout: null
         };
+    }
+
+    startVotingRound(topic, allowedChoices = null, votingTimeSeconds = 100) {
+        if (this.currentRound && this.currentRound.phase !== 'FINISHED') {
+            console.log('A voting round is already active!');
+            return;
+        }
+
+        // Validate voting time: min 30 seconds, max 600 seconds (10 minutes), default 100 seconds
+        // Note: This is pure voting time - consensus phase gets additional fixed time
+        if (typeof votingTimeSeconds !== 'number' || votingTimeSeconds < 30 || votingTimeSeconds > 600) {
+            console.log(`Invalid voting time: ${votingTimeSeconds}s. Using default 100 seconds.`);
+            console.log('   Valid range: 30-600 seconds (0.5-10 minutes) for voting phase only');
+            votingTimeSeconds = 100;
+        }
+
+        const roundId = `round_${Date.now()}_${this.nodeId}`;
+        
+        // Drop the previous round's ballots and keys - its results are already kept in this.results
+        this.releaseRoundData(this.currentRound);
+        
+        const round = this.createRound(roundId, topic, allowedChoices, Date.now(), votingTimeSeconds);
+        const { votingPhaseMs, consensusPhaseMs, duration: totalRoundMs } = round;
         
         this.currentRound = round;
         this.resultProposed = false; // Initialize result proposal flag
@@ -1366,6 +1440,7 @@ class VotingNodeWithAutoGUI {
         this.votes.set(roundId, new Map());
         this.encryptedVotes.set(roundId, new Map());
         this.voteKeys.set(roundId, new Map());
+        this.keyProviders.set(roundId, new Set());
         
         // Broadcast round start
         this.broadcast({
@@ -1405,31 +1480,19 @@ class VotingNodeWithAutoGUI {
 		if (!this.currentRound || this.currentRound.startTime < message.startTime) {
 			console.log(`Accepting new round from ${message.from}`);
 			
+			// A finished round's tally is already in this.results; a round still in
+			// VOTING/CONSENSUS is superseded by this newer one and discarded unrecorded
+			this.releaseRoundData(this.currentRound);
+			
 			const votingTimeSeconds = message.votingTimeSeconds || 100;
-			const votingPhaseMs = votingTimeSeconds * 1000;
-			const consensusPhaseMs = 15000; // Fixed 15 seconds for consensus
 			
-			this.currentRound = {
-				id: message.roundId,
-				topic: message.topic,
-				allowedChoices: message.allowedChoices,
-				startTime: message.startTime,
-				duration: votingPhaseMs + consensusPhaseMs,
-				votingTimeSeconds: votingTimeSeconds,
-				votingPhaseMs: votingPhaseMs,
-				consensusPhaseMs: consensusPhaseMs,
-				phase: 'VOTING',
-				votes: new Map(),
-				results: null,
-				consensusAchieved: false,
-				consensusNodes: new Set(),
-				consensusTimeout: null,
-				finishTimeout: null
-			};
+			this.currentRound = this.createRound(message.roundId, message.topic, message.allowedChoices, message.startTime, votingTimeSeconds);
+			const { votingPhaseMs, consensusPhaseMs } = this.currentRound;
 			
 			this.votes.set(message.roundId, new Map());
 			this.encryptedVotes.set(message.roundId, new Map());
 			this.voteKeys.set(message.roundId, new Map());
+			this.keyProviders.set(message.roundId, new Set());
 			this.resultProposed = false;
 			this.keysSharingComplete = false;
 			this.hasVotedInRound.set(message.roundId, false);
@@ -1458,6 +1521,16 @@ class VotingNodeWithAutoGUI {
 		}
 	}
 
+    // Frees a round's ballots and keys; callers must record anything they still need first
+    releaseRoundData(round) {
+        if (!round) return;
+        
+        this.votes.delete(round.id);
+        this.encryptedVotes.delete(round.id);
+        this.voteKeys.delete(round.id);
+        this.keyProviders.delete(round.id);
+    }
+
     checkIfReadyToPropose() {
         if (!this.currentRound || this.currentRound.phase !== 'CONSENSUS' || this.resultProposed) {
             return;
@@ -1479,15 +1552,13 @@ class VotingNodeWithAutoGUI {
         console.log(`Ready check: Have ${totalKeys}/${totalEncryptedVotes} decryption keys`);
         
         // Wait to ensure we've received key batches from all active nodes
-        const uniqueKeyProviders = new Set();
-        for (const [_, keyData] of voteKeys) {
-            if (keyData.keyProvider) {
-                uniqueKeyProviders.add(keyData.keyProvider);
-            }
+        if (!this.keyProviders.has(this.currentRound.id)) {
+            this.keyProviders.set(this.currentRound.id, new Set());
         }
+        const uniqueKeyProviders = this.keyProviders.get(this.currentRound.id);
         
         // Add ourselves if we have keys
-        if (this.voteKeys.get(this.currentRound.id) && this.voteKeys.get(this.currentRound.id).size > 0) {
+        if (voteKeys.size > 0) {
             uniqueKeyProviders.add(this.nodeId);
         }
         
@@ -1543,16 +1614,13 @@ class VotingNodeWithAutoGUI {
     }
 
     calculateResults() {
-        const roundVotes = this.votes.get(this.currentRound.id);
-        const tally = new Map();
-        
-        for (const vote of roundVotes.values()) {
-            const choice = vote.choice.toLowerCase();
-            tally.set(choice, (tally.get(choice) || 0) + 1);
+        // Proposals from every peer re-check the tally; only recount when new votes were decrypted
+        if (this.currentRound.resultsCache) {
+            return this.currentRound.resultsCache;
         }
         
-        // Convert to array and sort with stable ordering for ties
-        return Array.from(tally.entries())
+        // Convert the running tally to array and sort with stable ordering for ties
+        this.currentRound.resultsCache = Array.from(this.currentRound.tally.entries())
             .sort((a, b) => {
                 // First sort by vote count (descending)
                 if (b[1] !== a[1]) {
@@ -1562,6 +1630,8 @@ class VotingNodeWithAutoGUI {
                 return a[0].localeCompare(b[0]);
             })
             .map(([choice, count]) => ({ choice, count }));
+        
+        return this.currentRound.resultsCache;
     }
 
     handleResultProposal(message) {
@@ -1623,6 +1693,9 @@ class VotingNodeWithAutoGUI {
 			clearTimeout(this.currentRound.finishTimeout);
 		}
 		
+		// Catch any ballot whose key arrived without triggering a decrypt before tallying
+		this.decryptAndProcessVotes();
+		
 		this.currentRound.phase = 'FINISHED';
 		this.currentRound.results = this.calculateResults();
 		
@@ -1714,11 +1787,11 @@ class VotingNodeWithAutoGUI {
     // === UTILITY METHODS ===
 
     signMessage(message) {
-        return crypto.createHash('sha256').update(`${this.nodeId}_${message}`).digest('hex');
+        return sha256Hex(`${this.nodeId}_${message}`);
     }
     
     verifySignature(signature, message, fromNode) {
-        const expectedSignature = crypto.createHash('sha256').update(`${fromNode}_${message}`).digest('hex');
+        const expectedSignature = sha256Hex(`${fromNode}_${message}`);
         return signature === expectedSignature;
     }
     
@@ -2033,13 +2106,7 @@ class VotingNodeWithAutoGUI {
 		console.log(`\nKnown peers (${this.knownPeers.length}):`);
 		for (const peer of this.knownPeers) {
 			// Check if we're currently connected to this peer
-			let connectedNodeId = null;
-			for (const [nodeId, address] of this.peerAddresses) {
-				if (address.host === peer.host && address.port === peer.port) {
-					connectedNodeId = nodeId;
-					break;
-				}
-			}
+			const connectedNodeId = this.peerAddressIndex.get(`${peer.host}:${peer.port}`) || null;
 			
 			const status = connectedNodeId ? '✅' : '❌';
 			const nodeInfo = connectedNodeId ? ` (${connectedNodeId})` : '';